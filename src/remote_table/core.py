@@ -1,16 +1,61 @@
 import os
 import io
+import re
+import codecs
+import functools
+import hashlib
+import tempfile
 import requests
+import numpy as np
 import pandas as pd
 import json
 import importlib
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing
+    orjson = None
 
+# Integers wider than 64 bits need at least 19 digits. orjson converts them to
+# floats or rejects them depending on its version, so such documents go to json.
+_LONG_DIGITS = re.compile(rb'\d{19}')
+# Errors pandas' ujson raises for numbers it can't represent; only these are
+# retried with json.loads.
+_UJSON_RANGE_ERRORS = ('Value is too big', 'Value is too small', 'Range error')
+
+# Charset declarations that libxml2 honours on its own when parsing HTML.
+_DECLARED_CHARSET = re.compile(rb'<meta[^>]+charset|<\?xml[^>]+encoding', re.IGNORECASE)
+_CONTENT_TYPE_CHARSET = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Shared session so repeated loads from the same host reuse connections.
+_SESSION = requests.Session()
+
+# Formats whose readers take a seekable file: large downloads of these are
+# spooled to a temporary file instead of being held in memory.
+_SPOOLED_EXTENSIONS = ('xlsx', 'xls', 'ods', 'xml')
+_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# Rows converted per block when iterating all-numeric tables.
+_ROW_BLOCK = 65536
+
+# Options that change how a table is read, as opposed to how it is consumed.
+# Everything else goes into the cache key.
+_UNCACHED_OPTIONS = ('as_dict', 'cache_dir')
+
+# Formats whose parsers can consume the response body as a stream instead of
+# buffering it into memory first.
+_STREAMABLE_EXTENSIONS = ('csv', 'tsv')
+
+
+@functools.lru_cache(maxsize=None)
 def _lazy_import(module_name: str, package_hint: str | None = None):
     """Import a module on demand and raise a helpful error if missing.
 
     package_hint is the pip package name to suggest to the user (e.g. 'pyyaml').
+    Successful imports are memoized; failures are not, so installing the
+    package later in the same process still works.
     """
     try:
         return importlib.import_module(module_name)
@@ -20,6 +65,150 @@ def _lazy_import(module_name: str, package_hint: str | None = None):
             f"Missing optional dependency '{module_name}'. Install it with e.g. `pip install {hint}` to use this feature."
         ) from e
 
+
+@functools.lru_cache(maxsize=None)
+def _has_module(module_name: str) -> bool:
+    return importlib.util.find_spec(module_name) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _xpath(expr: str):
+    """Compile an XPath expression once and reuse it across rows and loads."""
+    return _lazy_import('lxml.etree', 'lxml').XPath(expr)
+
+
+def _is_clean_name(name) -> bool:
+    """True if _clean_headers would leave this column name unchanged."""
+    return (
+        isinstance(name, str)
+        and name == ' '.join(name.split())
+        and name != ''
+        and not name.lower().startswith('unnamed')
+    )
+
+
+def _mangle_duplicates(names):
+    """Rename repeated names a, a -> a, a.1 the way pd.read_csv does."""
+    counts = {}
+    new = []
+    for name in names:
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f'{name}.{count}'
+            count = counts.get(name, 0)
+        new.append(name)
+        counts[name] = count + 1
+    return new
+
+
+def _dedupe(names):
+    """Make names unique by appending _1, _2, ... to repeats, in order."""
+    seen = set()
+    new = []
+    for name in names:
+        base = name
+        suffix = 1
+        while name in seen:
+            name = f"{base}_{suffix}"
+            suffix += 1
+        seen.add(name)
+        new.append(name)
+    return new
+
+
+def _dict_rows(df: pd.DataFrame):
+    """Lazily yield each row of df as a {column: value} dict."""
+    columns = list(df.columns)
+    return (dict(zip(columns, row)) for row in df.itertuples(index=False, name=None))
+
+
+def _frame_from_rows(rows, fill=None) -> pd.DataFrame:
+    """Build a DataFrame with positional columns from an iterable of ragged rows.
+
+    Values are appended to one list per column as rows arrive, so pandas gets
+    ready-made columns instead of transposing a list of rows. Short rows are
+    padded with fill, as are earlier rows when a longer row adds columns.
+    """
+    columns = []
+    nrows = 0
+    for row in rows:
+        for i, value in enumerate(row):
+            if i == len(columns):
+                columns.append([fill] * nrows)
+            columns[i].append(value)
+        for column in columns[len(row):]:
+            column.append(fill)
+        nrows += 1
+    return pd.DataFrame(dict(enumerate(columns)))
+
+
+def _frame_from_json(obj, orient=None) -> pd.DataFrame:
+    """Build a DataFrame from parsed JSON laid out as pd.read_json's orient."""
+    if orient == 'index':
+        return pd.DataFrame.from_dict(obj, orient='index')
+    if orient == 'split':
+        return pd.DataFrame(**{k: obj[k] for k in ('data', 'index', 'columns') if k in obj})
+    if orient not in (None, 'columns', 'records', 'values'):
+        raise ValueError(f"orient '{orient}' is only supported by pd.read_json")
+    return pd.DataFrame(obj)
+
+
+def _tuple_rows(df: pd.DataFrame):
+    """Iterate over the rows of df as plain tuples of Python scalars."""
+    dtypes = set(df.dtypes)
+    if len(dtypes) == 1:
+        dtype = dtypes.pop()
+        if isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+            return _numeric_rows(df.to_numpy())
+    return df.itertuples(index=False, name=None)
+
+
+def _numeric_rows(values: np.ndarray):
+    # One contiguous array for the whole table; tolist() unboxes a block at a
+    # time in C and zip() over its columns builds the row tuples.
+    for start in range(0, len(values), _ROW_BLOCK):
+        yield from zip(*values[start:start + _ROW_BLOCK].T.tolist())
+
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name == 'utf-8'
+
+
+def _spool(resp):
+    """Copy a response body into a file that moves to disk past _SPOOL_MAX_SIZE."""
+    buf = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+    for chunk in resp.iter_content(1024 * 1024):
+        buf.write(chunk)
+    buf.seek(0)
+    return buf
+
+
+def _html_encoding(content: bytes, declared: str | None = None) -> str | None:
+    """Pick the encoding for lxml's HTML parser.
+
+    Returns None when the document carries a BOM or charset declaration for
+    libxml2 to honour. Otherwise libxml2 would assume Latin-1, so undeclared
+    documents are read as UTF-8, or Windows-1252 if they aren't valid UTF-8.
+    """
+    if declared:
+        return declared
+    boms = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+    if content.startswith(boms) or _DECLARED_CHARSET.search(content, 0, 4096):
+        return None
+    try:
+        content.decode('utf-8')
+    except UnicodeDecodeError:
+        return 'windows-1252'
+    return 'utf-8'
+
+
+def _as_file(content):
+    """Return a readable file-like object for either raw bytes or a stream."""
+    if hasattr(content, 'read'):
+        return content
+    return io.BytesIO(content)
+
 class RemoteTable:
     def __init__(self, source, **kwargs):
         self.source = source
@@ -31,76 +220,114 @@ class RemoteTable:
             self.kwargs.setdefault('headers', 'first_row')
         self.data = self._load()
 
+    @classmethod
+    def from_many(cls, sources, max_workers=8, **kwargs):
+        """Load several tables concurrently, returned in the order of sources.
+
+        Fetching and pandas' C parsers release the GIL, so threads overlap the
+        network round trips and most of the parsing. All tables share kwargs.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda source: cls(source, **kwargs), sources))
+
     def _load(self):
-        if self.source.startswith('http://') or self.source.startswith('https://'):
-            content = requests.get(self.source).content
-            ext = self.source.split('.')[-1].lower()
-        else:
-            with open(self.source, 'rb') as f:
-                content = f.read()
-            ext = self.source.split('.')[-1].lower()
-        df = None
-        if ext in ['csv', 'tsv']:
-            # CSV/TSV options
-            sep = '\t' if ext == 'tsv' else ','
-            sep = self.kwargs.get('delimiter', sep)
-            read_csv_kwargs = {
-                'sep': sep,
-            }
-            if self.kwargs.get('quote_char'):
-                read_csv_kwargs['quotechar'] = self.kwargs['quote_char']
-            if self.kwargs.get('skip'):
-                read_csv_kwargs['skiprows'] = self.kwargs['skip']
-            if self.kwargs.get('encoding'):
-                read_csv_kwargs['encoding'] = self.kwargs['encoding']
-            headers = self.kwargs.get('headers')
-            if headers is False:
-                read_csv_kwargs['header'] = None
-            elif isinstance(headers, (list, tuple)):
-                read_csv_kwargs['header'] = None
-                read_csv_kwargs['names'] = list(headers)
-            # BytesIO works for pandas read_csv
-            df = pd.read_csv(io.BytesIO(content), **read_csv_kwargs)
-        elif ext == 'json':
-            # support root_node option to select nested JSON arrays
-            text = content.decode(self.kwargs.get('encoding', 'utf-8')) if isinstance(content, (bytes, bytearray)) else content
-            obj = json.loads(text)
-            root = self.kwargs.get('root_node')
-            if root:
-                for part in root.split('.'):
-                    obj = obj.get(part, {})
-            df = pd.DataFrame(obj)
-        elif ext == 'xlsx':
-            # ensure openpyxl is available for .xlsx
-            _lazy_import('openpyxl', 'openpyxl')
-            excel_kwargs = {}
-            if 'sheet' in self.kwargs:
-                excel_kwargs['sheet_name'] = self.kwargs['sheet']
-            df = pd.read_excel(io.BytesIO(content), engine='openpyxl', **excel_kwargs)
-        elif ext == 'xls':
-            excel_kwargs = {}
-            if 'sheet' in self.kwargs:
-                excel_kwargs['sheet_name'] = self.kwargs['sheet']
-            df = pd.read_excel(io.BytesIO(content), **excel_kwargs)
-        elif ext == 'ods':
-            df = self._read_ods(content)
-        elif ext == 'yml' or ext == 'yaml':
-            # yaml parsing is optional
-            yaml = _lazy_import('yaml', 'pyyaml')
-            text = content.decode(self.kwargs.get('encoding', 'utf-8')) if isinstance(content, (bytes, bytearray)) else content
-            obj = yaml.safe_load(text)
-            root = self.kwargs.get('root_node')
-            if root:
-                for part in root.split('.'):
-                    obj = obj.get(part, {})
-            df = pd.DataFrame(obj)
-        elif ext == 'xml':
-            df = self._read_xml(content)
-        elif ext == 'html':
-            df = self._read_html(content)
-        else:
+        ext = self.source.rpartition('.')[2].lower()
+        if ext not in self._DISPATCH:
             raise ValueError(f'Unsupported file extension: {ext}')
+        # charset from the HTTP Content-Type header, if any
+        self._http_charset = None
+        if self.source.startswith('http://') or self.source.startswith('https://'):
+            cache_path = None
+            request_headers = {}
+            if self.kwargs.get('cache_dir') and not self.kwargs.get('chunksize'):
+                cache_path = self._cache_path()
+                request_headers = self._cache_validators(cache_path)
+            resp = _SESSION.get(self.source, stream=True, headers=request_headers)
+            content = None
+            try:
+                if cache_path and resp.status_code == 304:
+                    return pd.read_parquet(cache_path + '.parquet')
+                resp.raise_for_status()
+                charset = _CONTENT_TYPE_CHARSET.search(resp.headers.get('Content-Type', ''))
+                if charset:
+                    self._http_charset = charset.group(1)
+                if ext in _STREAMABLE_EXTENSIONS:
+                    # let urllib3 undo any Content-Encoding while pandas reads
+                    resp.raw.decode_content = True
+                    content = resp.raw
+                elif ext in _SPOOLED_EXTENSIONS:
+                    content = _spool(resp)
+                else:
+                    content = resp.content
+                data = self._parse(content, ext)
+                if cache_path:
+                    self._write_cache(cache_path, data, resp.headers)
+                return data
+            finally:
+                # a chunked reader keeps reading the stream after _load
+                # returns; urllib3 releases the connection at EOF
+                if not (self.kwargs.get('chunksize') and ext in _STREAMABLE_EXTENSIONS):
+                    resp.close()
+                if isinstance(content, tempfile.SpooledTemporaryFile):
+                    content.close()
+        with open(self.source, 'rb') as f:
+            content = f.read()
+        return self._parse(content, ext)
+
+    def _cache_path(self) -> str:
+        # Parquet round-trips need pyarrow (optional)
+        _lazy_import('pyarrow', 'pyarrow')
+        options = sorted((k, v) for k, v in self.kwargs.items() if k not in _UNCACHED_OPTIONS)
+        key = hashlib.blake2b(f'{self.source}\0{options!r}'.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.kwargs['cache_dir'], key)
+
+    def _cache_validators(self, cache_path: str) -> dict:
+        # conditional-GET headers for a previously cached response, if any
+        if not (os.path.exists(cache_path + '.parquet') and os.path.exists(cache_path + '.json')):
+            return {}
+        with open(cache_path + '.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def _write_cache(self, cache_path: str, df: pd.DataFrame, response_headers) -> None:
+        meta = {
+            'source': self.source,
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+        }
+        if not (meta['etag'] or meta['last_modified']):
+            # nothing to revalidate against, so a cached copy could never be used
+            return
+        cache_dir = self.kwargs['cache_dir']
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to temporary files and rename so concurrent loads never see a partial entry
+        fd, tmp_parquet = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_parquet, compression='zstd')
+        except (ValueError, TypeError):
+            # columns Arrow can't represent (e.g. mixed object types): skip caching
+            os.remove(tmp_parquet)
+            return
+        fd, tmp_meta = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_parquet, cache_path + '.parquet')
+        os.replace(tmp_meta, cache_path + '.json')
+
+    def _parse(self, content, ext):
+        df = self._DISPATCH[ext](self, content, ext)
+        if not isinstance(df, pd.DataFrame):
+            # chunked reads post-process each chunk as it is produced
+            return df
+        return self._postprocess(df)
 
+    def _postprocess(self, df: pd.DataFrame) -> pd.DataFrame:
         # Post-process headers and cleaning
         headers_opt = self.kwargs.get('headers')
         if headers_opt == 'first_row':
@@ -109,14 +336,32 @@ class RemoteTable:
         df = self._clean_headers(df)
         return df
 
+    def _iter_chunks(self, reader):
+        # The first chunk gets the usual header handling; later chunks reuse
+        # its columns so every chunk lines up with the same names.
+        columns = None
+        with reader:
+            for chunk in reader:
+                if columns is None:
+                    chunk = self._postprocess(chunk)
+                    columns = chunk.columns
+                else:
+                    chunk.columns = columns
+                yield chunk
+
     def _ensure_headers_from_first_row(self, df: pd.DataFrame) -> pd.DataFrame:
         # If the DataFrame columns look like positional integers (no headers),
         # and the first row holds header names, promote the first row to header.
         if df is None or df.shape[0] == 0:
             return df
         # Heuristic: if columns are numeric range or '0','1',..., treat first row as header
-        cols = list(df.columns)
-        numeric_cols = all(isinstance(c, (int,)) or (isinstance(c, str) and c.isdigit()) for c in cols)
+        cols = df.columns
+        if isinstance(cols, pd.RangeIndex) or pd.api.types.is_integer_dtype(cols.dtype):
+            numeric_cols = True
+        elif cols.inferred_type == 'string':
+            numeric_cols = bool(np.char.isdigit(cols.to_numpy(dtype=str)).all())
+        else:
+            numeric_cols = all(isinstance(c, (int,)) or (isinstance(c, str) and c.isdigit()) for c in cols)
         if numeric_cols:
             new_header = df.iloc[0].astype(str).tolist()
             df = df.iloc[1:].reset_index(drop=True)
@@ -124,87 +369,303 @@ class RemoteTable:
         return df
 
     def _clean_headers(self, df: pd.DataFrame) -> pd.DataFrame:
-        if df is None:
+        if df is None or len(df.columns) == 0:
             return df
-        cols = list(df.columns)
-        new = []
-        seen = set()
-        untitled_count = 0
-        for i, c in enumerate(cols):
-            name = '' if c is None else str(c)
-            # normalize whitespace
-            name = ' '.join(name.split())
-            name = name.strip()
-            if name == '' or name.lower().startswith('unnamed'):
-                untitled_count += 1
-                name = f'untitled_{untitled_count}'
-            base = name
-            suffix = 1
-            while name in seen:
-                name = f"{base}_{suffix}"
-                suffix += 1
-            seen.add(name)
-            new.append(name)
-        df.columns = new
+        if df.columns.is_unique and all(_is_clean_name(c) for c in df.columns):
+            # common case after pd.read_csv: nothing to rename
+            return df
+        names = pd.Series(df.columns, dtype=object)
+        names = names.where(names.notna(), '').astype(str)
+        # normalize whitespace
+        names = names.str.split().str.join(' ')
+        untitled = names.eq('') | names.str.lower().str.startswith('unnamed')
+        names = names.mask(untitled, 'untitled_' + untitled.cumsum().astype(str))
+        # suffix repeats: a, a, a -> a, a_1, a_2
+        repeat = names.groupby(names).cumcount()
+        deduped = names.mask(repeat > 0, names + '_' + repeat.astype(str))
+        if not deduped.is_unique:
+            # a generated suffix collided with an existing name (e.g. a, a_1, a)
+            deduped = _dedupe(names)
+        df.columns = list(deduped)
         return df
 
-    def _read_ods(self, content):
-        # ODS support is optional (odfpy)
+    def _read_csv(self, content, ext):
+        # CSV/TSV options
+        sep = '\t' if ext == 'tsv' else ','
+        sep = self.kwargs.get('delimiter', sep)
+        read_csv_kwargs = {
+            'sep': sep,
+        }
+        if self.kwargs.get('quote_char'):
+            read_csv_kwargs['quotechar'] = self.kwargs['quote_char']
+        if self.kwargs.get('skip'):
+            read_csv_kwargs['skiprows'] = self.kwargs['skip']
+        if self.kwargs.get('encoding'):
+            read_csv_kwargs['encoding'] = self.kwargs['encoding']
+        if self.kwargs.get('nrows'):
+            read_csv_kwargs['nrows'] = self.kwargs['nrows']
+        headers = self.kwargs.get('headers')
+        if headers is False:
+            read_csv_kwargs['header'] = None
+        elif isinstance(headers, (list, tuple)):
+            read_csv_kwargs['header'] = None
+            read_csv_kwargs['names'] = list(headers)
+        if self.kwargs.get('chunksize'):
+            # bounded memory: hand back an iterator of DataFrames
+            read_csv_kwargs['chunksize'] = self.kwargs['chunksize']
+            return self._iter_chunks(pd.read_csv(_as_file(content), **read_csv_kwargs))
+        use_arrow = (
+            self.kwargs.get('engine') == 'pyarrow'
+            and isinstance(self.kwargs.get('skip', 0), int)
+            and not self.kwargs.get('nrows')
+        )
+        if use_arrow:
+            if not isinstance(content, bytes):
+                # Arrow builds the whole table in memory anyway; holding the
+                # bytes allows a second pass and the pandas fallback below
+                content = content.read()
+            df = self._read_csv_pyarrow(content, sep)
+            if df is not None:
+                return df
+        return pd.read_csv(_as_file(content), **read_csv_kwargs)
+
+    def _read_csv_pyarrow(self, content, sep):
+        # Arrow's multithreaded CSV reader (optional, opt-in via engine='pyarrow').
+        # Returns None when Arrow can't parse the file so pandas can take over.
+        pa_csv = _lazy_import('pyarrow.csv', 'pyarrow')
+        read_options = {}
+        parse_options = {'delimiter': sep}
+        if self.kwargs.get('quote_char'):
+            parse_options['quote_char'] = self.kwargs['quote_char']
+        if self.kwargs.get('skip'):
+            read_options['skip_rows'] = self.kwargs['skip']
+        if self.kwargs.get('encoding'):
+            read_options['encoding'] = self.kwargs['encoding']
+        headers = self.kwargs.get('headers')
+        if headers is False:
+            read_options['autogenerate_column_names'] = True
+        elif isinstance(headers, (list, tuple)):
+            read_options['column_names'] = [str(h) for h in headers]
+        pa = _lazy_import('pyarrow', 'pyarrow')
+        # Arrow reads straight from the bytes without a BytesIO wrapper
+        source = pa.py_buffer(content)
+
+        def read(column_types=None):
+            return pa_csv.read_csv(
+                source,
+                read_options=pa_csv.ReadOptions(**read_options),
+                parse_options=pa_csv.ParseOptions(**parse_options),
+                # empty cells become NaN, as with pandas
+                convert_options=pa_csv.ConvertOptions(column_types=column_types or {}, strings_can_be_null=True),
+            )
+
+        try:
+            table = read()
+        except pa.ArrowInvalid:
+            # e.g. ragged rows, which pandas pads but Arrow rejects
+            return None
+        retype = {}
+        for field in table.schema:
+            if pa.types.is_temporal(field.type):
+                # pandas leaves date/time-like text as strings
+                retype[field.name] = pa.string()
+            elif pa.types.is_null(field.type):
+                # all-blank columns: float64 NaN, as pandas infers them
+                retype[field.name] = pa.float64()
+        if retype:
+            table = read(retype)
+        df = table.to_pandas()
+        if headers is False:
+            # match pandas' positional column labels instead of Arrow's f0, f1, ...
+            df.columns = range(df.shape[1])
+        elif not isinstance(headers, (list, tuple)):
+            # match pandas' naming of blank (Unnamed: N) and repeated (a, a.1) header cells
+            names = [name or f'Unnamed: {i}' for i, name in enumerate(df.columns)]
+            df.columns = _mangle_duplicates(names)
+        return df
+
+    def _read_json(self, content, ext):
+        # support root_node option to select nested JSON arrays
+        root = self.kwargs.get('root_node')
+        encoding = self.kwargs.get('encoding', 'utf-8')
+        use_orjson = orjson is not None and _is_utf8(encoding) and not _LONG_DIGITS.search(content)
+        if not root and (not use_orjson or self.kwargs.get('orient')):
+            # pandas' bundled ujson parser is faster than the stdlib json module;
+            # its conversions are off so the result matches pd.DataFrame(obj)
+            json_kwargs = {
+                'dtype': False,
+                'convert_dates': False,
+                'convert_axes': False,
+                'precise_float': True,
+                'encoding': encoding,
+            }
+            if self.kwargs.get('orient'):
+                json_kwargs['orient'] = self.kwargs['orient']
+            try:
+                return pd.read_json(_as_file(content), **json_kwargs)
+            except ValueError as exc:
+                # ujson can't hold integers wider than 64 bits or some extreme
+                # floats; json.loads can. Anything else (malformed JSON, bad
+                # orient) is a real error.
+                if not str(exc).startswith(_UJSON_RANGE_ERRORS):
+                    raise
+                use_orjson = False
+        if not _is_utf8(encoding):
+            content = content.decode(encoding)
+        # both parsers take UTF-8 bytes directly, no decoded copy needed
+        obj = None
+        if use_orjson:
+            try:
+                obj = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # not strict RFC 8259 (NaN/Infinity literals, 1e400, ...); json accepts it
+                use_orjson = False
+        if not use_orjson:
+            obj = json.loads(content)
+        if root:
+            for part in root.split('.'):
+                obj = obj.get(part, {})
+        return _frame_from_json(obj, self.kwargs.get('orient'))
+
+    def _read_excel(self, content, ext):
+        excel_kwargs = {}
+        if _has_module('python_calamine'):
+            # one Rust reader for xlsx and xls (optional)
+            excel_kwargs['engine'] = 'calamine'
+        elif ext == 'xlsx':
+            # ensure openpyxl is available for .xlsx
+            _lazy_import('openpyxl', 'openpyxl')
+            excel_kwargs['engine'] = 'openpyxl'
+        if 'sheet' in self.kwargs:
+            excel_kwargs['sheet_name'] = self.kwargs['sheet']
+        return pd.read_excel(_as_file(content), **excel_kwargs)
+
+    def _read_yaml(self, content, ext):
+        # yaml parsing is optional
+        yaml = _lazy_import('yaml', 'pyyaml')
+        encoding = self.kwargs.get('encoding', 'utf-8')
+        if not _is_utf8(encoding):
+            content = content.decode(encoding)
+        # libyaml's C loader when PyYAML was built with it; it reads bytes as-is
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        obj = yaml.load(content, Loader=loader)
+        root = self.kwargs.get('root_node')
+        if root:
+            for part in root.split('.'):
+                obj = obj.get(part, {})
+        return pd.DataFrame(obj)
+
+    def _read_ods(self, content, ext):
+        # ODS support is optional (odfpy). Not routed through calamine: it
+        # returns typed cell values, while odfpy gives the displayed text.
         odf_module = _lazy_import('odf.opendocument', 'odfpy')
         table_module = _lazy_import('odf.table', 'odfpy')
-        load_ods = odf_module.load
+        extract_text = _lazy_import('odf.teletype', 'odfpy').extractText
         Table = table_module.Table
         TableRow = table_module.TableRow
         TableCell = table_module.TableCell
-        ods = load_ods(io.BytesIO(content))
+        ods = odf_module.load(_as_file(content))
+        # one sheet, chosen like pd.read_excel's sheet_name: position or name
         tables = ods.spreadsheet.getElementsByType(Table)
-        rows = []
-        for table in tables:
-            for row in table.getElementsByType(TableRow):
-                cells = [cell.plaintext() for cell in row.getElementsByType(TableCell)]
-                rows.append(cells)
-        return pd.DataFrame(rows)
-
-    def _read_xml(self, content):
-        # XML parsing via lxml (optional)
-        lxml = _lazy_import('lxml.etree', 'lxml')
-        etree = lxml
-        tree = etree.fromstring(content)
-        rows = []
-        for row in tree.findall('.//row'):
-            rows.append([cell.text for cell in row])
-        return pd.DataFrame(rows)
-
-    def _read_html(self, content):
-        # HTML parsing via BeautifulSoup (optional)
-        bs4 = _lazy_import('bs4', 'beautifulsoup4')
-        BeautifulSoup = bs4.BeautifulSoup
-        soup = BeautifulSoup(content, 'lxml')
-        # allow selecting rows/columns by CSS if provided
+        sheet = self.kwargs.get('sheet', 0)
+        if isinstance(sheet, str):
+            matches = [t for t in tables if t.getAttribute('name') == sheet]
+            if not matches:
+                raise ValueError(f"Worksheet named '{sheet}' not found")
+            table = matches[0]
+        else:
+            table = tables[sheet]
+        rows = (
+            [extract_text(cell) for cell in row.getElementsByType(TableCell)]
+            for row in table.getElementsByType(TableRow)
+        )
+        return _frame_from_rows(rows, fill='')
+
+    def _read_xml(self, content, ext):
+        # XML parsing via lxml (optional). Stream <row> elements instead of
+        # building the whole document tree first.
+        etree = _lazy_import('lxml.etree', 'lxml')
+
+        def rows():
+            for _, row in etree.iterparse(_as_file(content), tag='row'):
+                cells = [cell.text for cell in row]
+                row.clear()
+                # drop finished rows so their parent doesn't keep them alive
+                while row.getprevious() is not None:
+                    del row.getparent()[0]
+                yield cells
+
+        return _frame_from_rows(rows())
+
+    def _read_html(self, content, ext):
         row_selector = self.kwargs.get('row_css')
         col_selector = self.kwargs.get('column_css')
+        if row_selector or col_selector:
+            return self._read_html_css(content, row_selector, col_selector)
+        # default path walks the tree with lxml's C-level XPath (optional)
+        lxml_html = _lazy_import('lxml.html', 'lxml')
+        encoding = _html_encoding(content, self.kwargs.get('encoding') or self._http_charset)
+        parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+        doc = lxml_html.document_fromstring(content, parser=parser)
+        table = _xpath('.//table')(doc)[self.kwargs.get('table_index') or 0]
+        cells_of = _xpath('.//td|.//th')
+        return _frame_from_rows([td.text_content() for td in cells_of(tr)] for tr in _xpath('.//tr')(table))
+
+    def _read_html_css(self, content, row_selector, col_selector):
+        # CSS selectors need BeautifulSoup (optional)
+        bs4 = _lazy_import('bs4', 'beautifulsoup4')
+        BeautifulSoup = bs4.BeautifulSoup
+        # BeautifulSoup sniffs the encoding itself unless one is known up front
+        soup = BeautifulSoup(content, 'lxml', from_encoding=self.kwargs.get('encoding') or self._http_charset)
         table = soup.find('table') if not self.kwargs.get('table_index') else soup.find_all('table')[self.kwargs.get('table_index')]
-        rows = []
         if row_selector:
             tr_elements = table.select(row_selector)
         else:
             tr_elements = table.find_all('tr')
-        for tr in tr_elements:
-            if col_selector:
-                cells = [c.get_text() for c in tr.select(col_selector)]
-            else:
-                cells = [td.get_text() for td in tr.find_all(['td', 'th'])]
-            rows.append(cells)
-        return pd.DataFrame(rows)
+
+        def rows():
+            for tr in tr_elements:
+                if col_selector:
+                    yield [c.get_text() for c in tr.select(col_selector)]
+                else:
+                    yield [td.get_text() for td in tr.find_all(['td', 'th'])]
+
+        return _frame_from_rows(rows())
+
+    # extension -> reader; each reader takes (self, content, ext)
+    _DISPATCH = {
+        'csv': _read_csv,
+        'tsv': _read_csv,
+        'json': _read_json,
+        'xlsx': _read_excel,
+        'xls': _read_excel,
+        'ods': _read_ods,
+        'yml': _read_yaml,
+        'yaml': _read_yaml,
+        'xml': _read_xml,
+        'html': _read_html,
+    }
 
     def __iter__(self):
         # allow iterating as dict rows when requested
         # Return an iterator in both cases. Avoid using `yield` in one branch
         # and `return` in the other because that makes the function a
         # generator and breaks the non-generator branch.
+        if not isinstance(self.data, pd.DataFrame):
+            return self._iter_chunk_rows()
         if self.kwargs.get('as_dict'):
-            return iter(self.data.to_dict('records'))
-        return self.data.itertuples(index=False, name=None)
+            return _dict_rows(self.data)
+        return _tuple_rows(self.data)
+
+    def _iter_chunk_rows(self):
+        # rows from a chunked read; only one chunk is in memory at a time
+        as_dict = self.kwargs.get('as_dict')
+        for chunk in self.data:
+            if as_dict:
+                yield from _dict_rows(chunk)
+            else:
+                yield from _tuple_rows(chunk)
 
     def to_dataframe(self):
+        # with chunksize this is the (single-use) iterator of DataFrame chunks
         return self.data
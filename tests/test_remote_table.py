@@ -6,6 +6,7 @@ SRC = os.path.join(ROOT, 'src')
 sys.path.insert(0, SRC)
 
 import unittest
+import tempfile
 import importlib
 import importlib.util
 from unittest import mock
@@ -38,6 +39,26 @@ class TestRemoteTable(unittest.TestCase):
         self.assertTrue(len(rows) > 0)
         self.assertIsInstance(rows[0], tuple)
 
+    def test_numeric_rows(self):
+        # all-int and all-float tables iterate from one ndarray in blocks
+        if core_mod is None:
+            self.skipTest('core module not importable')
+        bodies = {
+            'ints.csv': 'a,b,c\n' + ''.join(f'{i},{i * 2},{-i}\n' for i in range(10)),
+            'floats.csv': 'a,b\n' + ''.join(f'{i / 3},{i * 1.5}\n' for i in range(10)),
+        }
+        with tempfile.TemporaryDirectory() as tmp, mock.patch('remote_table.core._ROW_BLOCK', 3):
+            for name, body in bodies.items():
+                path = os.path.join(tmp, name)
+                with open(path, 'w') as f:
+                    f.write(body)
+                table = RemoteTable(path)
+                rows = list(table)
+                expected = list(table.data.itertuples(index=False, name=None))
+                self.assertEqual(len(rows), 10)
+                self.assertEqual(rows, expected)
+                self.assertEqual([[type(v) for v in row] for row in rows], [[type(v) for v in row] for row in expected])
+
     def test_json(self):
         path = os.path.join(os.path.dirname(__file__), 'data', 'data_no_root.json')
         if not has_module('pandas') or RemoteTable is None:
@@ -46,6 +67,84 @@ class TestRemoteTable(unittest.TestCase):
         rows = list(table)
         self.assertTrue(len(rows) > 0)
 
+    def test_json_without_orjson(self):
+        # the pd.read_json path must match json.loads + pd.DataFrame exactly
+        if core_mod is None:
+            self.skipTest('core module not importable')
+        import json
+        import pandas as pd
+        bodies = [
+            # float-heavy: read by pd.read_json
+            b'[{"a": 1.0000000000000002, "b": 2.2250738585072014e-308, "c": 0.1},'
+            b' {"a": 3.141592653589793, "b": 1.7976931348623157e+308, "c": 5e-324}]',
+            # wider than 64 bits: falls back to json.loads
+            b'[{"a": 12345678901234567890123, "b": 1.5}]',
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'numbers.json')
+            for body in bodies:
+                with open(path, 'wb') as f:
+                    f.write(body)
+                with mock.patch('remote_table.core.orjson', None):
+                    rows = list(RemoteTable(path))
+                expected = list(pd.DataFrame(json.loads(body)).itertuples(index=False, name=None))
+                self.assertEqual(rows, expected)
+                self.assertEqual([type(v) for v in rows[0]], [type(v) for v in expected[0]])
+
+    def test_json_big_integers(self):
+        # integers wider than 64 bits stay exact whichever JSON parser is installed
+        if RemoteTable is None:
+            self.skipTest('remote_table not available')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'big.json')
+            with open(path, 'wb') as f:
+                f.write(b'{"data": [{"a": 12345678901234567890123, "b": 1}]}')
+            rows = list(RemoteTable(path, root_node='data'))
+        self.assertEqual(rows, [(12345678901234567890123, 1)])
+
+    def test_json_big_integers_with_orient(self):
+        # the json.loads fallback keeps the layout pd.read_json gives the orient
+        if RemoteTable is None:
+            self.skipTest('remote_table not available')
+        big = 12345678901234567890123
+        documents = {
+            'index': '{"r1": {"a": %d, "b": 2}, "r2": {"a": 3, "b": 4}}',
+            'split': '{"columns": ["a", "b"], "index": ["r1", "r2"], "data": [[%d, 2], [3, 4]]}',
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            for orient, document in documents.items():
+                path = os.path.join(tmp, orient + '.json')
+                tables = []
+                for value in (1, big):
+                    with open(path, 'w') as f:
+                        f.write(document % value)
+                    table = RemoteTable(path, orient=orient)
+                    tables.append((list(table.data.columns), list(table)))
+                self.assertEqual(tables[0][0], ['a', 'b'], orient)
+                self.assertEqual(tables[1], (tables[0][0], [(big, 2), (3, 4)]), orient)
+            # malformed documents are reported, not retried with json.loads
+            path = os.path.join(tmp, 'broken.json')
+            with open(path, 'w') as f:
+                f.write('{"r1": {"a": 1,')
+            with mock.patch('remote_table.core.json.loads') as loads:
+                with self.assertRaises(ValueError):
+                    RemoteTable(path, orient='index')
+            loads.assert_not_called()
+
+    def test_json_non_strict_numbers(self):
+        # NaN/Infinity literals and out-of-range numbers, as json.dumps writes them
+        if RemoteTable is None:
+            self.skipTest('remote_table not available')
+        import math
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'nan.json')
+            with open(path, 'wb') as f:
+                f.write(b'{"data": [{"a": NaN, "b": 1}, {"a": Infinity, "b": 2}, {"a": 1e400, "b": 3}]}')
+            rows = list(RemoteTable(path, root_node='data'))
+        self.assertTrue(math.isnan(rows[0][0]))
+        self.assertEqual(rows[1:], [(math.inf, 2), (math.inf, 3)])
+        self.assertEqual([row[1] for row in rows], [1, 2, 3])
+
     def test_html(self):
         path = os.path.join(os.path.dirname(__file__), 'data', 'table.html')
         if not has_module('bs4') or RemoteTable is None:
@@ -54,6 +153,65 @@ class TestRemoteTable(unittest.TestCase):
         rows = list(table)
         self.assertTrue(len(rows) > 0)
 
+    def test_ods(self):
+        path = os.path.join(os.path.dirname(__file__), 'data', 'list-en1-semic-3.neooffice.binary.ods')
+        if not has_module('odf') or RemoteTable is None:
+            self.skipTest('odfpy or remote_table not available')
+        table = RemoteTable(path)
+        rows = list(table)
+        self.assertTrue(len(rows) > 0)
+        self.assertIn(('AFGHANISTAN', 'AF'), rows)
+
+    def test_ods_same_with_and_without_calamine(self):
+        if not has_module('odf') or not has_module('python_calamine') or RemoteTable is None:
+            self.skipTest('odfpy, python-calamine or remote_table not available')
+        # text-only sheet plus numbers, dates, booleans and a blank cell
+        for name in ('list-en1-semic-3.neooffice.binary.ods', 'mixed_types.ods'):
+            path = os.path.join(os.path.dirname(__file__), 'data', name)
+            results = []
+            for available in (True, False):
+                with mock.patch('remote_table.core._has_module', return_value=available):
+                    table = RemoteTable(path)
+                    results.append((list(table.data.columns), list(table)))
+            self.assertEqual(results[0], results[1], name)
+
+    def test_clean_headers(self):
+        if not has_module('pandas') or core_mod is None:
+            self.skipTest('pandas or core module not available')
+        import pandas as pd
+        clean = core_mod.RemoteTable._clean_headers
+        cases = [
+            # repeats get numbered suffixes
+            (['a', 'a', 'a'], ['a', 'a_1', 'a_2']),
+            # a generated suffix colliding with an existing name
+            (['a', 'a_1', 'a'], ['a', 'a_1', 'a_2']),
+            # missing (None/NaN, once stringified to 'nan') and blank names
+            # become untitled_N; whitespace is normalized
+            ([None, float('nan'), ' ', ' x \t y '], ['untitled_1', 'untitled_2', 'untitled_3', 'x y']),
+            # unique, stripped names still lose pandas' Unnamed: N placeholders
+            (['Unnamed: 0', 'b', 'unnamed_c'], ['untitled_1', 'b', 'untitled_2']),
+            # generated untitled names are de-duplicated against real ones
+            (['untitled_1', ''], ['untitled_1', 'untitled_1_1']),
+            # non-string labels are stringified
+            ([0, 1, 1], ['0', '1', '1_1']),
+        ]
+        for columns, expected in cases:
+            df = pd.DataFrame([range(len(columns))], columns=columns)
+            self.assertEqual(list(clean(None, df).columns), expected, columns)
+        # already clean: returned untouched
+        df = pd.DataFrame([[1, 2]], columns=['a', 'b c'])
+        self.assertIs(clean(None, df), df)
+        self.assertEqual(list(df.columns), ['a', 'b c'])
+
+    def test_html_utf8_without_charset(self):
+        # no <meta charset>: must not fall back to Latin-1
+        path = os.path.join(os.path.dirname(__file__), 'data', 'utf8_no_charset.html')
+        if not has_module('lxml') or not has_module('bs4') or RemoteTable is None:
+            self.skipTest('lxml, bs4 or remote_table not available')
+        expected = [{'Año': '2020', 'Nombre': 'José'}]
+        self.assertEqual(list(RemoteTable(path, as_dict=True)), expected)
+        self.assertEqual(list(RemoteTable(path, as_dict=True, row_css='tr')), expected)
+
     def test_header_promotion(self):
         # CSV where first row is headers
         path = os.path.join(os.path.dirname(__file__), 'data', 'color.csv')
@@ -67,21 +225,93 @@ class TestRemoteTable(unittest.TestCase):
         # the CSV header file uses 'en','es','ru'
         self.assertIn('en', rows[0].keys())
 
+    def test_from_many(self):
+        data = os.path.join(os.path.dirname(__file__), 'data')
+        if not has_module('pandas') or RemoteTable is None:
+            self.skipTest('pandas or remote_table not available')
+        paths = [os.path.join(data, 'color.csv'), os.path.join(data, 'ranges.csv')]
+        tables = RemoteTable.from_many(paths, max_workers=2)
+        self.assertEqual([list(t) for t in tables], [list(RemoteTable(p)) for p in paths])
+
+    def test_cache_dir(self):
+        path = os.path.join(os.path.dirname(__file__), 'data', 'data_no_root.json')
+        if not has_module('pyarrow') or core_mod is None:
+            self.skipTest('pyarrow or core module not available')
+        with open(path, 'rb') as f:
+            body = f.read()
+        fresh = mock.Mock(status_code=200, content=body, headers={'ETag': '"v1"'})
+        not_modified = mock.Mock(status_code=304, headers={})
+        url = 'https://example.com/data.json'
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch('remote_table.core._SESSION') as session:
+                session.get.side_effect = [fresh, not_modified]
+                first = RemoteTable(url, cache_dir=cache_dir)
+                second = RemoteTable(url, cache_dir=cache_dir)
+            self.assertEqual(list(second), list(first))
+            self.assertEqual(session.get.call_args.kwargs['headers'], {'If-None-Match': '"v1"'})
+
+    def test_csv_chunksize(self):
+        path = os.path.join(os.path.dirname(__file__), 'data', 'color.csv')
+        if not has_module('pandas') or RemoteTable is None:
+            self.skipTest('pandas or remote_table not available')
+        chunks = list(RemoteTable(path, chunksize=1).to_dataframe())
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(list(chunks[1].columns), ['en', 'es', 'ru'])
+        self.assertEqual(list(RemoteTable(path, chunksize=1, as_dict=True)), list(RemoteTable(path, as_dict=True)))
+
+    def test_csv_pyarrow_engine(self):
+        path = os.path.join(os.path.dirname(__file__), 'data', 'color.csv')
+        if not has_module('pyarrow') or RemoteTable is None:
+            self.skipTest('pyarrow or remote_table not available')
+        table = RemoteTable(path, engine='pyarrow')
+        expected = RemoteTable(path)
+        self.assertEqual(list(table), list(expected))
+        self.assertEqual(list(table.data.columns), list(expected.data.columns))
+
+    def test_csv_pyarrow_engine_dates_and_duplicate_headers(self):
+        path = os.path.join(os.path.dirname(__file__), 'data', 'dates.csv')
+        if not has_module('pyarrow') or RemoteTable is None:
+            self.skipTest('pyarrow or remote_table not available')
+        table = RemoteTable(path, engine='pyarrow')
+        expected = RemoteTable(path)
+        self.assertEqual(list(table.data.columns), ['name', 'date', 'date.1', 'time', 'stamp'])
+        self.assertEqual(list(table.data.columns), list(expected.data.columns))
+        self.assertEqual(list(table), list(expected))
+        self.assertIsInstance(list(table)[0][1], str)
+
+    def test_csv_pyarrow_engine_blank_column(self):
+        # Arrow types an all-blank column as null; pandas reads it as float64 NaN
+        path = os.path.join(os.path.dirname(__file__), 'data', 'blank_column.csv')
+        if not has_module('pyarrow') or RemoteTable is None:
+            self.skipTest('pyarrow or remote_table not available')
+        table = RemoteTable(path, engine='pyarrow')
+        expected = RemoteTable(path)
+        self.assertEqual(list(table.data.dtypes), list(expected.data.dtypes))
+        self.assertEqual(str(table.data.dtypes['notes']), 'float64')
+        self.assertEqual(repr(list(table)), repr(list(expected)))
+
     def test_missing_dependency_html(self):
-        # Simulate bs4 missing to ensure helpful ImportError is raised
+        # Simulate lxml/bs4 missing to ensure helpful ImportError is raised
         if core_mod is None:
             self.skipTest('core module not importable')
         path = os.path.join(os.path.dirname(__file__), 'data', 'table.html')
-        # Patch core._lazy_import to raise ImportError for bs4
+        # Patch core._lazy_import to raise ImportError for the HTML parsers
         orig_lazy = core_mod._lazy_import
         def fake_lazy(name, hint=None):
             if name.startswith('bs4'):
                 raise ImportError("Missing optional dependency 'bs4'. Install it with e.g. `pip install beautifulsoup4`")
+            if name.startswith('lxml'):
+                raise ImportError(f"Missing optional dependency '{name}'. Install it with e.g. `pip install lxml`")
             return orig_lazy(name, hint)
         # Patch the _lazy_import used by the installed package namespace
         with mock.patch('remote_table.core._lazy_import', side_effect=fake_lazy):
+            # default path uses lxml
             with self.assertRaises(ImportError) as cm:
                 RemoteTable(path)
+            self.assertIn('lxml', str(cm.exception))
+            # CSS selectors use BeautifulSoup
+            with self.assertRaises(ImportError) as cm:
+                RemoteTable(path, row_css='tr')
             self.assertIn('beautifulsoup4', str(cm.exception))
 
 if __name__ == '__main__':